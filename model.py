@@ -1,10 +1,138 @@
-try:
-    import xlwings as xw
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # numpy is only imported when used, by _Util.get_np()
+    import numpy
+
+try:  # only importable when run by an office program through PyUno
+    import uno  # sets up importing of com.sun.star modules
+    from com.sun.star.container import NoSuchElementException
+    from com.sun.star.lang import IndexOutOfBoundsException
+    from com.sun.star.table.CellContentType import \
+        FORMULA as FORMULA_CONTENT, TEXT as TEXT_CONTENT, \
+        VALUE as VALUE_CONTENT
 except ImportError:
-    xw = None
+    uno = NoSuchElementException = IndexOutOfBoundsException = None
+    FORMULA_CONTENT = TEXT_CONTENT = VALUE_CONTENT = None
+
+_interface_class = None  # Office interface class, once found
 
 MAX_CELL_GAP = 10  # max distance between inhabited cells in the workbook
 DEFAULT_COLOR = -1
+_AXES = frozenset({'x', 'y'})  # valid CellLine axes; along rows, columns
+
+
+class _Util:
+    """
+    Helper functions used by classes in this module.
+    Like Office, these are kept in a class rather than as independent
+    functions, which would each appear as their own macro.
+    """
+    xw = None  # xlwings module, once imported by get_xw()
+    np = None  # numpy module, once imported by get_np()
+
+    @staticmethod
+    def get_xw():
+        """
+        Gets xlwings module, importing it on first use, so that its
+        import cost is not paid when another interface is being used.
+        :return: xlwings module, or None if xlwings is not installed
+        """
+        if _Util.xw is None:
+            try:
+                import xlwings
+            except ImportError:
+                return None
+            _Util.xw = xlwings
+        return _Util.xw
+
+    @staticmethod
+    def get_np():
+        """
+        Gets numpy module, importing it on first use, so that its
+        import cost is only paid by callers of bulk array methods.
+        :return: numpy module, or None if numpy is not installed
+        """
+        if _Util.np is None:
+            try:
+                import numpy
+            except ImportError:
+                return None
+            _Util.np = numpy
+        return _Util.np
+
+    @staticmethod
+    def check_index(index: int) -> None:
+        """
+        Checks that passed cell index is an int of 0 or more, raising
+        TypeError or ValueError if not.
+        :param index: int
+        :return: None
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                'get_cell_by_index: passed non-int index: %s' % index)
+        if index < 0:
+            raise ValueError(
+                'get_cell_by_index: passed index is < 0: %s' % index)
+
+    @staticmethod
+    def collapse_whitespace(string: str) -> str:
+        """
+        Strips whitespace from the ends of passed string, and replaces
+        each run of whitespace characters (tab, linefeed, return,
+        form-feed, vertical tab, etc) within it by a single space.
+        :param string: str
+        :return: str
+        """
+        # str.split / join measured faster than an equivalent compiled
+        # regex substitution, for both short and long strings.
+        return ' '.join(string.split())
+
+    @staticmethod
+    def trim_line_values(values: list) -> list:
+        """
+        Truncates list of values read from a line of cells at the point
+        where iteration over that line would stop; before the first
+        empty value that is followed by MAX_CELL_GAP - 1 more empty
+        values (or by the end of the list).
+        This allows values read in bulk to match the cells yielded by
+        iterating over a Row or Column.
+        :param values: list
+        :return: list
+        """
+        gap = 0  # number of consecutive empty values
+        for i, value in enumerate(values):
+            if value is None or value == '':
+                gap += 1
+                if gap == MAX_CELL_GAP:
+                    return values[:i - gap + 1]
+            else:
+                gap = 0
+        return values[:len(values) - gap]
+
+    @staticmethod
+    def block_array(rows: list) -> numpy.ndarray | list:
+        """
+        Gets 2d numpy array from passed list of equal length lists of
+        cell values, if numpy is available. The array has a float dtype
+        if all values are floats, otherwise an object dtype.
+        If numpy is not installed, the list is returned unchanged.
+        :param rows: list[list]
+        :return: np.ndarray or list[list]
+        """
+        np = _Util.get_np()
+        if np is None:
+            return rows
+        if all(type(value) is float for row in rows for value in row):
+            return np.array(rows, dtype=float)
+        array = np.empty(
+            (len(rows), len(rows[0]) if rows else 0), dtype=object)
+        array[:] = rows  # avoids numpy unpacking any sequence values
+        return array
+
 
 ###############################################################################
 # BOOK INTERFACE
@@ -18,7 +146,7 @@ class Model:
     def __init__(self) -> None:
         raise NotImplementedError
 
-    def __getitem__(self, item: str or int):
+    def __getitem__(self, item: str | int):
         """
         Gets sheet from model, either by the str name of the sheet,
         or the int index.
@@ -85,6 +213,7 @@ class WorkBookComponent:
     Abstract class with common methods for classes that exist within
     a workbook.
     """
+    __slots__ = ('__value_cache', '__enduring_cache')
     sheet = None
 
     @property
@@ -179,21 +308,32 @@ class WorkBookComponent:
             :return: None
             """
             assert isinstance(o, WorkBookComponent)
-            # for each WorkBookComponent modified, clear its cache
-            modified_components = \
-                [o] + [parent for parent in o.instantiated_parents]
-            for component in modified_components:
-                try:  # try to find cache.
-                    cache = component.__value_cache
-                except AttributeError:
-                    pass
-                else:  # if cell has a cache, clear it.
-                    assert isinstance(cache, dict)
-                    cache.clear()
+            o._clear_value_caches()
             setter(o, *args, **kwargs)  # call original value setter method
 
         return setter_wrapper
 
+    def _clear_value_caches(self) -> None:
+        """
+        Clears value caches of this WorkBookComponent and of its
+        instantiated parents.
+        This is called by setters decorated with clear_cache, and
+        should also be called when values of this component are
+        changed by other means, such as a bulk write to a range.
+        :return: None
+        """
+        # for each WorkBookComponent modified, clear its cache
+        modified_components = \
+            [self] + [parent for parent in self.instantiated_parents]
+        for component in modified_components:
+            try:  # try to find cache.
+                cache = component.__value_cache
+            except AttributeError:
+                pass
+            else:  # if cell has a cache, clear it.
+                assert isinstance(cache, dict)
+                cache.clear()
+
 
 class Sheet(WorkBookComponent):
     """
@@ -249,7 +389,7 @@ class Sheet(WorkBookComponent):
 
     def get_column(
             self,
-            column_identifier: int or float or str
+            column_identifier: int | float | str
     ) -> 'Column':
         """
         Gets column by name if identifier is str, otherwise,
@@ -275,7 +415,7 @@ class Sheet(WorkBookComponent):
             reference_index=self.reference_column_index
         )
 
-    def get_column_by_name(self, column_name: int or float or str) -> 'Column':
+    def get_column_by_name(self, column_name: int | float | str) -> 'Column':
         """
         Gets column from a passed reference value which is compared
         to each cell value in the reference row.
@@ -288,19 +428,16 @@ class Sheet(WorkBookComponent):
 
     def get_column_index_from_name(
         self,
-        column_name: int or float or str
-    ) -> int or None:
+        column_name: int | float | str
+    ) -> int | None:
         """
         Gets column index from name
         :param column_name: int, float, or str
         :return: int or None
         """
-        # todo: cache this
-        for x, cell in enumerate(self.reference_row):
-            if cell.value == column_name:
-                return x
+        return self._column_name_indices.get(column_name)
 
-    def get_row(self, row_identifier: int or float or str) -> 'Row':
+    def get_row(self, row_identifier: int | float | str) -> 'Row':
         """
         Gets row by name if identifier is str, otherwise by index
         :param row_identifier: int, float, or str
@@ -311,7 +448,7 @@ class Sheet(WorkBookComponent):
         else:
             return self.get_row_by_index(row_identifier)
 
-    def get_row_by_index(self, row_index: int or str) -> 'Row':
+    def get_row_by_index(self, row_index: int | str) -> 'Row':
         """
         Gets row by passed index.
         Implemented by subclasses.
@@ -324,7 +461,7 @@ class Sheet(WorkBookComponent):
             reference_index=self.reference_row_index
         )
 
-    def get_row_by_name(self, row_name: int or str or float) -> 'Row':
+    def get_row_by_name(self, row_name: int | str | float) -> 'Row':
         """
         Gets row from a passed reference value which is compared
         to each cell value in the reference row.
@@ -337,16 +474,68 @@ class Sheet(WorkBookComponent):
 
     def get_row_index_from_name(
             self,
-            row_name: int or float or str
-    ) -> int or None:
+            row_name: int | float | str
+    ) -> int | None:
         """
         Gets index of a row from passed name
         :param row_name: int, float, or str
         :return: int or None
         """
-        for y, cell in enumerate(self.reference_column):
-            if cell.value == row_name:
-                return y
+        return self._row_name_indices.get(row_name)
+
+    @property
+    @WorkBookComponent.value_cache
+    def _column_name_indices(self) -> dict:
+        """
+        Gets dict of column indices, keyed by the value of each cell
+        in the reference row.
+        Where a name occurs more than once, the first index is kept.
+        :return: dict
+        """
+        indices = {}
+        for x, value in enumerate(self.reference_row.values):
+            indices.setdefault(value, x)
+        return indices
+
+    @property
+    @WorkBookComponent.value_cache
+    def _row_name_indices(self) -> dict:
+        """
+        Gets dict of row indices, keyed by the value of each cell
+        in the reference column.
+        Where a name occurs more than once, the first index is kept.
+        :return: dict
+        """
+        indices = {}
+        for y, value in enumerate(self.reference_column.values):
+            indices.setdefault(value, y)
+        return indices
+
+    def _get_line_values(
+            self,
+            axis: str,
+            index: int,
+            start: int=0,
+            stop: int=None
+    ) -> list:
+        """
+        Gets list of values of cells in the row (axis 'x') or
+        column (axis 'y') of passed index, from start up to but not
+        including stop.
+        If stop is None, values up to the end of the line are returned.
+        Reads each cell individually here; subclasses able to read
+        many cells at once may override this method.
+        :param axis: str
+        :param index: int
+        :param start: int
+        :param stop: int or None
+        :return: list
+        """
+        if stop is None:
+            return [cell.value for cell in CellLine(self, axis, index)][start:]
+        positions = ((index, i) if axis == 'y' else (i, index)
+                     for i in range(start, stop))
+        return [self.get_cell_by_position(x, y).value for x, y in positions]
 
     def get_cell(self, cell_identifier, **kwargs) -> 'Cell':
         """
@@ -393,11 +582,128 @@ class Sheet(WorkBookComponent):
                 assert isinstance(y_identifier, int)  # sanity check
                 y = y_identifier
             # We now have x and y indices for the cell
-            # now we call the cell factory method, which returns a cell
-            # of the correct type. The Cell factory method will not
-            # create duplicate cells, instead it will return a
-            # reference to the pre-existing cell in that sheet+position
-            return Cell.factory(sheet=self, position=(x, y))
+            return self.get_cell_by_position(x, y)
+
+    def get_cell_by_position(self, x: int, y: int) -> 'Cell':
+        """
+        Gets cell at passed x, y indices.
+        Unlike get_cell, this does not check or interpret the passed
+        indices, and is intended for callers such as CellLine that
+        generate them.
+        :param x: int
+        :param y: int
+        :return: Cell
+        """
+        # the Cell factory method returns a cell of the correct type.
+        # It will not create duplicate cells, instead it will return a
+        # reference to the pre-existing cell in that sheet+position
+        return Cell.factory(sheet=self, position=(x, y))
+
+    def read_block(self, r1: int, c1: int, r2: int, c2: int):
+        """
+        Gets values of the rectangular block of cells from row r1,
+        column c1 to row r2, column c2 (inclusive) without creating
+        a Cell for each, for callers repeatedly reading a region.
+        Values are returned as a 2d numpy array indexed [row, column]
+        if numpy is installed (with dtype float if every value is a
+        float, otherwise object), or else as a list of row lists.
+        :param r1: int
+        :param c1: int
+        :param r2: int
+        :param c2: int
+        :return: np.ndarray or list[list]
+        """
+        if not all(isinstance(i, int) for i in (r1, c1, r2, c2)):
+            raise TypeError('Sheet:read_block: row and column indices '
+                            'should be ints. Got: %s' % ((r1, c1, r2, c2),))
+        if r1 < 0 or c1 < 0 or r2 < r1 or c2 < c1:
+            raise ValueError('Sheet:read_block: block (%s, %s) - (%s, %s) '
+                             'is not valid' % (r1, c1, r2, c2))
+        return _Util.block_array(self._read_block_values(r1, c1, r2, c2))
+
+    def write_block(self, r1: int, c1: int, values) -> None:
+        """
+        Sets values of the rectangular block of cells whose top left
+        cell is at row r1, column c1, from the passed 2d array or
+        list of row lists, as returned by read_block.
+        :param r1: int
+        :param c1: int
+        :param values: np.ndarray or list[list]
+        :return: None
+        """
+        if not isinstance(r1, int) or not isinstance(c1, int):
+            raise TypeError('Sheet:write_block: row and column indices '
+                            'should be ints. Got: %s' % ((r1, c1),))
+        if r1 < 0 or c1 < 0:
+            raise ValueError('Sheet:write_block: row and column indices '
+                             'must be 0 or greater. Got: %s' % ((r1, c1),))
+        np = _Util.get_np()
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()  # numpy scalars -> python values
+        rows = [list(row) for row in values]
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError('Sheet:write_block: rows of passed values '
+                             'should all be of the same length')
+        if rows and rows[0]:
+            self._write_block_values(r1, c1, rows)
+
+    def _read_block_values(self, r1: int, c1: int, r2: int, c2: int) -> list:
+        """
+        Gets list of row lists of values in the block of cells from
+        row r1, column c1 to row r2, column c2 (inclusive).
+        Reads each cell individually here; subclasses able to read
+        many cells at once may override this method.
+        :param r1: int
+        :param c1: int
+        :param r2: int
+        :param c2: int
+        :return: list[list]
+        """
+        return [[self.get_cell_by_position(x, y).value
+                 for x in range(c1, c2 + 1)]
+                for y in range(r1, r2 + 1)]
+
+    def _write_block_values(self, r1: int, c1: int, rows: list) -> None:
+        """
+        Sets values of the block of cells whose top left cell is at
+        row r1, column c1 from passed list of equal length row lists.
+        Writes each cell individually here; subclasses able to write
+        many cells at once may override this method.
+        :param r1: int
+        :param c1: int
+        :param rows: list[list]
+        :return: None
+        """
+        for y, row in enumerate(rows, r1):
+            for x, value in enumerate(row, c1):
+                self.get_cell_by_position(x, y).value = value
+
+    def _clear_block_caches(self, r1: int, c1: int, r2: int, c2: int) -> None:
+        """
+        Clears value caches of instantiated cells in the block from
+        row r1, column c1 to row r2, column c2 (inclusive), and those
+        of the rows and columns crossing it, and of this sheet.
+        This is to be called after values of the block have been
+        changed without using the setters of each cell.
+        :param r1: int
+        :param c1: int
+        :param r2: int
+        :param c2: int
+        :return: None
+        """
+        sheet_key = repr(self)
+        cells = Cell._all_cells
+        for y in range(r1, r2 + 1):
+            if Row.exists(self, y):
+                self.get_row_by_index(y)._clear_value_caches()
+            for x in range(c1, c2 + 1):
+                cell = cells.get((sheet_key, (x, y)))
+                if cell is not None:
+                    cell._clear_value_caches()
+        for x in range(c1, c2 + 1):
+            if Column.exists(self, x):
+                self.get_column_by_index(x)._clear_value_caches()
+        self._clear_value_caches()
 
     @property
     def reference_row_index(self) -> int:
@@ -408,6 +714,7 @@ class Sheet(WorkBookComponent):
         return self._reference_row_index
 
     @reference_row_index.setter
+    @WorkBookComponent.clear_cache
     def reference_row_index(self, new_index: int) -> None:
         """
         Sets reference row by passing the index of the new row.
@@ -436,6 +743,7 @@ class Sheet(WorkBookComponent):
         return self._reference_column_index
 
     @reference_column_index.setter
+    @WorkBookComponent.clear_cache
     def reference_column_index(self, new_index) -> None:
         """
         Sets reference column by passing the index of the new
@@ -572,6 +880,9 @@ class Sheet(WorkBookComponent):
         :param frozen_size: bool
         :return: None
         """
+        # any previous snapshot is dropped first, so that the sizes and
+        # values of the new snapshot are read from the sheet itself.
+        self._snapshot = None
         if height is None:
             height = len(self.reference_column)
         if width is None:
@@ -598,11 +909,11 @@ class Sheet(WorkBookComponent):
         self._snapshot = None
 
     @property
-    def snapshot(self) -> None or 'Snapshot':
+    def snapshot(self) -> Snapshot | None:
         return self._snapshot
 
     @property
-    def screen_updating(self) -> bool or None:
+    def screen_updating(self) -> bool | None:
         """
         Gets bool of whether screen updating occurs on sheet.
         does nothing here, may be overridden by subclasses.
@@ -622,13 +933,29 @@ class Sheet(WorkBookComponent):
         """
         return
 
+    @contextmanager
+    def batch(self):
+        """
+        Context manager within which the office program defers work
+        such as recalculation and redrawing that would otherwise
+        follow each change made to the sheet.
+        Loops setting the values or colors of many cells should be
+        run within it, as in:
+        with sheet.batch():
+            for cell in column:
+                cell.clear()
+        Does nothing here, subclasses may implement this method.
+        :return: Generator
+        """
+        yield
+
     @property
     def parents(self):
-        return  # nothing to yield or return
+        return ()  # nothing to yield
 
     @property
     def instantiated_parents(self):
-        return  # nothing to yield or return
+        return ()  # nothing to yield
 
     def __str__(self) -> str:
         raise NotImplementedError
@@ -680,7 +1007,8 @@ class Sheet(WorkBookComponent):
             width_difference = new_width - self._width
             # first add rows
             if height_difference:
-                self._values += [[None] * new_width] * height_difference
+                self._values += \
+                    [[None] * new_width for _ in range(height_difference)]
             # then columns
             if width_difference:
                 for i in range(0, self._height):  # for each pre-existing row
@@ -688,7 +1016,7 @@ class Sheet(WorkBookComponent):
             self._width = new_width
             self._height = new_height
 
-        def get_value(self, x: int, y: int) -> str or float or int or None:
+        def get_value(self, x: int, y: int) -> str | float | int | None:
             """"
             Gets value of cell at x, y.
             Throws IndexError if x or y is outside range of snapshot.
@@ -721,7 +1049,7 @@ class Sheet(WorkBookComponent):
             :param value: Any
             :return: None
             """
-            if not isinstance(value, (int, float, str, None)):
+            if not isinstance(value, (int, float, str, type(None))):
                 raise TypeError(
                     'Snapshot:set_value: Passed value should be an int, float'
                     ' , str, or None. Got: %s' % repr(value))
@@ -745,6 +1073,7 @@ class Sheet(WorkBookComponent):
 
 class LineSeries:
     """Class storing collection of Line, Column, or Row objects"""
+    __slots__ = ('reference_line', 'start_index', 'end_index', '_is_columns')
 
     COLUMNS_STR = 'columns'
     ROWS_STR = 'rows'
@@ -755,14 +1084,17 @@ class LineSeries:
             start_index: int=0,  # iterator start index
             end_index: int=None,  # iterator end index (exclusive)
     ) -> None:
-        if not isinstance(reference_line, Line):
-            raise TypeError('Expected LineSeries to be passed reference line.'
-                            'Got instead: %s' % repr(reference_line))
+        if not isinstance(reference_line, (Row, Column)):
+            raise TypeError('Expected LineSeries to be passed reference Row '
+                            'or Column. Got instead: %s' %
+                            repr(reference_line))
         self.reference_line = reference_line
         self.start_index = start_index
         self.end_index = end_index
+        # a series with a reference row holds columns, otherwise rows
+        self._is_columns = isinstance(reference_line, Row)
 
-    def __getitem__(self, item: int or float or str):
+    def __getitem__(self, item: int | float | str):
         """
         If item is int, returns line of that index, otherwise looks
         for a line of that name.
@@ -784,40 +1116,40 @@ class LineSeries:
             ref_cells = self.reference_line[self.start_index:self.end_index]
         else:
             ref_cells = self.reference_line[self.start_index:]
-        for cell in ref_cells:
-            if self._contents_type == LineSeries.COLUMNS_STR:
+        if self._is_columns:
+            for cell in ref_cells:
                 yield cell.column
-            if self._contents_type == LineSeries.ROWS_STR:
-                yield cell.rows
+        else:
+            for cell in ref_cells:
+                yield cell.row
 
     def __len__(self) -> int:
         """
-        Returns size of LineSeries
+        Returns size of LineSeries.
+        This is derived from the length of the reference line, since
+        each line in the series has its name cell in that line.
         :return: int
         """
-        count = self.start_index
-        try:  # it feels like there should be a better way to do this
-            assert self.end_index is None or isinstance(self.end_index, int)
-            # while there is a next cell, and it is inside range
-            while self.__iter__().__next__() and \
-                    (self.end_index is None or count + 1 < self.end_index):
-                count += 1  # increment count
-        except StopIteration:
-            return count
+        assert self.end_index is None or isinstance(self.end_index, int)
+        stop = len(self.reference_line)
+        if self.end_index is not None and self.end_index < stop:
+            stop = self.end_index
+        return max(stop - self.start_index, 0)
 
-    def get_by_name(self, name: int or float or str) -> 'Line':
+    def get_by_name(self, name: int | float | str) -> 'Line':
         """
         Gets line from passed line name.
         Returns None if no line of that name is found.
         :param name: int, float or str
         :return: Line or None
         """
-        for cell in self.reference_line:
-            if cell.value == name:
-                if self._contents_type == LineSeries.COLUMNS_STR:
-                    return cell.column
-                elif self._contents_type == LineSeries.ROWS_STR:
-                    return cell.row
+        # the reference line of a series is the sheet's reference
+        # row or column, so its cached name lookups may be used.
+        if self._is_columns:
+            index = self.sheet.get_column_index_from_name(name)
+        else:
+            index = self.sheet.get_row_index_from_name(name)
+        return self.get_by_index(index) if index is not None else None
 
     def get_by_index(self, index: int) -> 'Line':
         """
@@ -825,10 +1157,10 @@ class LineSeries:
         :param index:
         :return: Line
         """
-        if self._contents_type == 'rows':
-            return self.sheet.get_row_by_index(index)
-        elif self._contents_type == 'columns':
+        if self._is_columns:
             return self.sheet.get_column_by_index(index)
+        else:
+            return self.sheet.get_row_by_index(index)
 
     @property
     def sheet(self) -> Sheet:
@@ -872,13 +1204,8 @@ class LineSeries:
         Gets the str name of line series; either 'columns' or 'rows'
         :return: str
         """
-        if isinstance(self.reference_line, Row):
-            return 'columns'
-        elif isinstance(self.reference_line, Column):
-            return 'rows'
-        else:
-            raise TypeError('Expected reference_line to be Row or'
-                            'Column. Got: %s' % repr(self.reference_line))
+        return LineSeries.COLUMNS_STR if self._is_columns else \
+            LineSeries.ROWS_STR
 
 
 class Line(WorkBookComponent):
@@ -886,6 +1213,7 @@ class Line(WorkBookComponent):
     Abstract class for a line of cells.
     Sub-classed by both Row and Column
     """
+    __slots__ = ('sheet', 'index', 'reference_index', '_name_cell')
     _all = {}  # overwritten in sub-classes.
 
     def __init__(
@@ -897,7 +1225,6 @@ class Line(WorkBookComponent):
         # check if an instance already exists in dict of all Row/Col.
         # It shouldn't.
         assert (sheet, index) not in self._all
-        self._all[(sheet, index)] = self  # add self to _all dict
         if not isinstance(sheet, Sheet):
             raise TypeError(
                 'Expected subclass of Sheet. Instead got %s'
@@ -917,6 +1244,8 @@ class Line(WorkBookComponent):
         self.sheet = sheet
         self.index = index
         self.reference_index = index
+        # add self to _all dict only once validated and initialized
+        self._all[(sheet, index)] = self
 
     def __getitem__(self, cell_identifier):  # returns Cell or Generator
         """
@@ -940,15 +1269,16 @@ class Line(WorkBookComponent):
             return self.get_cell_by_reference(cell_identifier)
 
     def __iter__(self):
-        raise NotImplementedError
-        # implemented by office program specific subclasses
+        """
+        Returns iterable line of cells.
+        Office program specific subclasses able to find the extent
+        of the line more quickly may override this method.
+        :return: Iterable
+        """
+        return self.get_iterator(self._axis)
 
-    @WorkBookComponent.value_cache
     def __len__(self) -> int:
-        count = 0
-        for _ in self:
-            count += 1
-        return count
+        return len(self.values)
 
     @classmethod
     def exists(cls, sheet: Sheet, index: int):
@@ -958,7 +1288,7 @@ class Line(WorkBookComponent):
         :param index: int
         :return: bool
         """
-        return sheet, index in cls._all
+        return (sheet, index) in cls._all
 
     def slice(self, s: slice):  # return cell generator
         """
@@ -966,12 +1296,13 @@ class Line(WorkBookComponent):
         :param s: slice
         :return: Generator[Cell]
         """
+        length = len(self)  # may read the whole line, so found once
         if s.start is None:
             start = 0
         else:
             start = s.start
         if s.stop is None:
-            stop = len(self)
+            stop = length
         else:
             stop = s.stop
         if s.step is not None:
@@ -979,7 +1310,7 @@ class Line(WorkBookComponent):
         else:
             rng = range(start, stop)
         for i in rng:
-            if i in range(len(self)):
+            if 0 <= i < length:
                 yield self[i]
 
     def get_cell_by_index(self, index: int) -> 'Cell':
@@ -992,13 +1323,28 @@ class Line(WorkBookComponent):
         # implemented by Row and Column in office program
         # specific subclasses
 
-    def get_cell_by_reference(self, reference: str or float or int) -> 'Cell':
-        for i, cell in enumerate(self._reference_line):
-            if cell.value == reference:
-                return self.get_cell_by_index(i)
+    def _unchecked_get_cell_by_index(self, index: int) -> 'Cell':
+        """
+        Gets cell in Line at passed index, without first checking it,
+        for use where the index is known to be a valid int, such
+        as when it has been generated by iteration over the line.
+        :param index: int
+        :return: Cell
+        """
+        raise NotImplementedError
+        # implemented by Row and Column
+
+    def get_cell_by_reference(self, reference: str | float | int) -> 'Cell':
+        """
+        Gets cell in Line whose position in the line matches that of
+        the passed name in the sheet's reference row or column.
+        Implemented by Row and Column.
+        :param reference: str, float or int
+        :return: Cell or None
+        """
+        raise NotImplementedError
 
     def get_iterator(self, axis: str) -> 'CellLine':
-        assert axis == 'x' or axis == 'y'
         return CellLine(self.sheet, axis, self.index)
 
     def clear(self, include_header: bool = False) -> None:
@@ -1009,8 +1355,10 @@ class Line(WorkBookComponent):
         :param include_header: bool
         :return: None
         """
-        [cell.clear() for i, cell in enumerate(self)
-         if i > self.name_cell_index or include_header]
+        name_cell_index = self.name_cell_index
+        for i, cell in enumerate(self):
+            if i > name_cell_index or include_header:
+                cell.clear()
 
     @property
     def _reference_line(self) -> 'Line':
@@ -1026,13 +1374,20 @@ class Line(WorkBookComponent):
     def duplicates(self):
         """
         Returns generator of duplicate cells in Column.
+        Values of the line are read together, and cells are only
+        fetched for the duplicates found.
         :return: cells (iterator)
         """
+        values = self.values
         cell_values = set()
-        for cell in self:
-            if cell.value_without_whitespace in cell_values:
-                yield cell
-            cell_values.add(cell.value_without_whitespace)
+        add_value = cell_values.add
+        for i, value in enumerate(values):
+            if isinstance(value, str):  # compare without whitespace
+                value = _Util.collapse_whitespace(value)
+            if value in cell_values:
+                yield self._unchecked_get_cell_by_index(i)
+            else:
+                add_value(value)
 
     @property
     def name_cell_index(self) -> int:
@@ -1043,14 +1398,40 @@ class Line(WorkBookComponent):
         raise NotImplementedError
 
     @property
-    def name(self) -> int or float or str or None:
+    def name(self) -> int | float | str | None:
         """
         Returns name of line, which is the value stored in the
         line's header cell, located in the sheet's reference
         row or column.
+        The header cell is kept, along with its index, so that it
+        need not be looked up again while the sheet's reference index
+        is unchanged. Its value is cached by the Cell itself where
+        possible.
         :return: int, float, str or None
         """
-        return self[self.name_cell_index].value
+        index = self.name_cell_index
+        try:
+            cell_index, cell = self._name_cell
+        except AttributeError:
+            cell_index = cell = None
+        if cell_index != index:
+            cell = self.get_cell_by_index(index)
+            self._name_cell = index, cell
+        return cell.value
+
+    @property
+    @WorkBookComponent.value_cache
+    def values(self) -> tuple:
+        """
+        Gets tuple of the values of cells in Line, as would be
+        returned by iterating over the Line and getting each cell's
+        value.
+        Values are read together where the sheet interface allows it,
+        rather than cell by cell, so this should be preferred where
+        Cell objects themselves are not needed.
+        :return: tuple
+        """
+        return tuple(self.sheet._get_line_values(self._axis, self.index))
 
     def to_dict(self) -> dict:
         """
@@ -1058,8 +1439,7 @@ class Line(WorkBookComponent):
         and corresponding reference row values as keys.
         :return: dict
         """
-        return {line_cell.value: ref_cell.value for
-                line_cell, ref_cell in zip(self, self._reference_line)}
+        return dict(zip(self.values, self._reference_line.values))
 
     def __repr__(self) -> str:
         return '%s(sheet=%s, index(0-base)=%s, ref_index=%s) name: %s' % (
@@ -1090,7 +1470,21 @@ class Column(Line):
     """
     Abstract Column class, extended by Office.XW.Column and Office.Uno.Column
     """
+    __slots__ = ()
     _all = {}  # dict storing all unique sheet+index possibilities
+    _axis = 'y'  # axis along which cells of a Column are iterated
+
+    def __init__(
+            self,
+            sheet: Sheet,
+            column_index: int,
+            reference_column_index: int=0
+    ) -> None:
+        super().__init__(
+            sheet=sheet,
+            index=column_index,
+            reference_index=reference_column_index,
+        )
 
     @staticmethod
     def factory(sheet: 'Sheet', index: int, reference_index: int) -> 'Column':
@@ -1116,15 +1510,20 @@ class Column(Line):
         :param index: int
         :return: Cell
         """
-        if not isinstance(index, int):
-            raise TypeError(
-                'get_cell_by_index: passed non-int index: %s' % index
-            )
-        if index < 0:
-            raise ValueError(
-                'get_cell_by_index: passed index is < 0: %s' % index
-            )
-        return self.sheet.get_cell((self.index, index))
+        _Util.check_index(index)
+        return self.sheet.get_cell_by_position(self.index, index)
+
+    def _unchecked_get_cell_by_index(self, index: int) -> 'Cell':
+        return self.sheet.get_cell_by_position(self.index, index)
+
+    def get_cell_by_reference(self, reference: str | float | int) -> 'Cell':
+        """
+        Gets cell in Column which is in the row of the passed name.
+        :param reference: str, float or int
+        :return: Cell or None
+        """
+        y = self.sheet.get_row_index_from_name(reference)
+        return self.get_cell_by_index(y) if y is not None else None
 
     @property
     def _reference_line(self) -> 'Line':
@@ -1148,7 +1547,21 @@ class Row(Line):
     """
     Abstract Row obj. Extended by Office.XW.Row and Office.Uno.Row
     """
+    __slots__ = ()
     _all = {}  # dict storing all unique sheet+index possibilities
+    _axis = 'x'  # axis along which cells of a Row are iterated
+
+    def __init__(
+            self,
+            sheet: Sheet,
+            row_index: int,
+            reference_row_index: int=0
+    ) -> None:
+        super().__init__(
+            sheet=sheet,
+            index=row_index,
+            reference_index=reference_row_index,
+        )
 
     @staticmethod
     def factory(sheet: 'Sheet', index: int, reference_index: int) -> 'Row':
@@ -1174,15 +1587,20 @@ class Row(Line):
         :param index: int
         :return: Cell
         """
-        if not isinstance(index, int):
-            raise TypeError(
-                'get_cell_by_index: passed non-int index: %s' % index
-            )
-        if index < 0:
-            raise ValueError(
-                'get_cell_by_index: passed index is < 0: %s' % index
-            )
-        return self.sheet.get_cell((index, self.index))
+        _Util.check_index(index)
+        return self.sheet.get_cell_by_position(index, self.index)
+
+    def _unchecked_get_cell_by_index(self, index: int) -> 'Cell':
+        return self.sheet.get_cell_by_position(index, self.index)
+
+    def get_cell_by_reference(self, reference: str | float | int) -> 'Cell':
+        """
+        Gets cell in Row which is in the column of the passed name.
+        :param reference: str, float or int
+        :return: Cell or None
+        """
+        x = self.sheet.get_column_index_from_name(reference)
+        return self.get_cell_by_index(x) if x is not None else None
 
     @property
     def _reference_line(self) -> 'Line':
@@ -1210,6 +1628,7 @@ class Row(Line):
 
 class Cell(WorkBookComponent):
     """ Class handling usage of a single cell in office worksheet """
+    __slots__ = ('sheet', 'position')
     _all_cells = {}  # dict of all created cells, prevents duplication
 
     def __init__(
@@ -1218,7 +1637,7 @@ class Cell(WorkBookComponent):
             position: tuple
     ) -> None:
         assert len(position) == 2
-        assert all([isinstance(item, int) for item in position])
+        assert all(isinstance(item, int) for item in position)
         self.position = tuple(position)
         self.sheet = sheet
 
@@ -1242,7 +1661,7 @@ class Cell(WorkBookComponent):
                 Office.get_cell_class()(sheet, position)
         return cell
 
-    def set_color(self, color: int or list or tuple or Color) -> None:
+    def set_color(self, color: int | list | tuple | Color) -> None:
         """
         Sets color in cell to that passed as
         integer (as in a color hex code),
@@ -1288,7 +1707,9 @@ class Cell(WorkBookComponent):
         If cell contains a number, returns False.
         :return: bool
         """
-        return self.value_without_whitespace != self.value
+        value = self.value
+        return isinstance(value, str) and \
+            _Util.collapse_whitespace(value) != value
 
     @property
     def value_without_whitespace(self) -> str:
@@ -1297,13 +1718,14 @@ class Cell(WorkBookComponent):
         If cell is not a string, returns value unchanged.
         :return:
         """
-        if isinstance(self.value, str):
-            return ' '.join(self.value.split())
+        value = self.value
+        if isinstance(value, str):
+            return _Util.collapse_whitespace(value)
         else:
-            return self.value
+            return value
 
     @property
-    def value(self) -> int or float or str or None:
+    def value(self) -> int | float | str | None:
         """
         Gets value contained in sheet cell.
         Does not return only number values.
@@ -1312,7 +1734,7 @@ class Cell(WorkBookComponent):
         raise NotImplementedError
 
     @value.setter
-    def value(self, new_value: str or int or float or None) -> None:
+    def value(self, new_value: str | int | float | None) -> None:
         """
         Sets cell value.
         :param new_value: str, int, float, or None
@@ -1349,7 +1771,7 @@ class Cell(WorkBookComponent):
         raise NotImplementedError
 
     @float.setter
-    def float(self, new_float: int or float) -> None:
+    def float(self, new_float: int | float) -> None:
         """
         Sets float value of cell.
         :param new_float: int or float
@@ -1396,7 +1818,7 @@ class Cell(WorkBookComponent):
         if Row.exists(self.sheet, self.y):
             yield self.row
         if Column.exists(self.sheet, self.x):
-            yield self.row
+            yield self.column
         yield self.sheet
 
     def __repr__(self) -> str:
@@ -1416,16 +1838,11 @@ class CellLine:
     """
     Generator iterator that returns cells of a particular row or column
     """
-    sheet = None
-    axis = None
-    index = None
-    i = 0
-    highest_inhabited_i = -1
-
-    # max_i = 0
+    __slots__ = (
+        'sheet', 'axis', 'index', 'i', 'highest_inhabited_i', '_position')
 
     def __init__(self, sheet: Sheet, axis: str, index: int) -> None:
-        assert axis in ('x', 'y')
+        assert axis in _AXES
         if not isinstance(sheet, Sheet):
             raise TypeError('CellLine Constructor sheet arg should be a Sheet.'
                             ' Got instead: %s' % sheet.__repr__())
@@ -1435,22 +1852,25 @@ class CellLine:
         self.sheet = sheet
         self.axis = axis
         self.index = index
+        self.i = 0
+        self.highest_inhabited_i = -1
+        # function returning x, y position of the cell at passed i
+        self._position = (lambda i: (index, i)) if axis == 'y' else \
+            (lambda i: (i, index))
 
     def __iter__(self):
         return self
 
     def __next__(self) -> 'Cell':
-        # set starting x, y values
-        x, y = (self.index, self.i) if self.axis == 'y' else \
-            (self.i, self.index)
-        cell = self.sheet.get_cell((x, y))  # get first cell
+        # get first cell
+        cell = self.sheet.get_cell_by_position(*self._position(self.i))
         # if cell is empty, look to see if a cell with a value follows.
+        # following values are read together, rather than cell by cell.
         if cell.string == '' and self.i > self.highest_inhabited_i:
-            for i in range(1, MAX_CELL_GAP):
-                test_x, test_y = (self.index, self.i + i) if \
-                    self.axis == 'y' else (self.i + i, self.index)
-                test_cell = self.sheet.get_cell((test_x, test_y))
-                if test_cell.string != '':
+            following_values = self.sheet._get_line_values(
+                self.axis, self.index, self.i + 1, self.i + MAX_CELL_GAP)
+            for i, value in enumerate(following_values, 1):
+                if value is not None and value != '':
                     # if there is, mark that index as the highest i searched
                     # and break.
                     self.highest_inhabited_i = self.i + i
@@ -1506,7 +1926,8 @@ class Office:
                     self.active_app = app_
                 else:
                     try:
-                        self.active_app = xw.apps[0]  # get first app open
+                        # get first app open
+                        self.active_app = _Util.get_xw().apps[0]
                     except IndexError:
                         raise EnvironmentError(
                             'Office does not appear to have any running '
@@ -1514,6 +1935,7 @@ class Office:
                         )
                 # there should be only one open at a given time usually,
                 # if any.
+                self._sheet_index = {}  # built by first sheet lookup
 
             def sheet_exists(self, *sheet_name: str) -> str:
                 """
@@ -1523,44 +1945,75 @@ class Office:
                 :param sheet_name: str
                 :return: str
                 """
+                rebuilt = False  # index is rebuilt at most once per call
                 for sheet_name_ in sheet_name:
-                    if "::" in sheet_name_:
+                    if not isinstance(sheet_name_, str):
+                        continue
+                    xw_sheet = self._find_xw_sheet(sheet_name_)
+                    if xw_sheet is None and not rebuilt:
+                        self._sheet_index = self._get_sheet_index()
+                        rebuilt = True
+                        xw_sheet = self._find_xw_sheet(sheet_name_)
+                    if xw_sheet is not None:
                         # if book/sheet name separator is in sheet_name,
-                        # first find the book, then sheet
-                        book_name, sheet_name_ = sheet_name_.split("::")
-                        try:
-                            book = self.active_app.books[book_name]
-                            sheet = book.sheets[sheet_name_]
-                        except KeyError:
-                            continue
-                        else:
-                            assert sheet.name == sheet_name_
-                            return sheet_name_
-                    else:
-                        # otherwise just find the sheet name
-                        for sheet in self._xw_sheets:
-                            if sheet_name_ == sheet.name:
-                                return sheet_name_
-
-            def __getitem__(self, item: str or int):
+                        # return only the sheet name
+                        return sheet_name_.split("::")[-1]
+
+            def __getitem__(self, item: str | int):
                 """
                 Gets passed item, returning the sheet of that name.
                 :param item:
                 :return: Sheet
                 """
-                if isinstance(item, str) and "::" in item:
-                    # split and find book + name
-                    book_name, sheet_name = item.split("::")
-                    return Sheet.factory(
-                        self.active_app.books[book_name].sheets[sheet_name]
-                    )
-                else:
-                    # otherwise just look everywhere
-                    for sheet in self._xw_sheets:
-                        if sheet.name == item:
-                            return Sheet.factory(
-                                sheet
-                            )
+                if not isinstance(item, str):
+                    return None
+                xw_sheet = self._find_xw_sheet(item)
+                if xw_sheet is None:
+                    self._sheet_index = self._get_sheet_index()
+                    xw_sheet = self._find_xw_sheet(item)
+                if xw_sheet is not None:
+                    return Sheet.factory(xw_sheet)
+                if "::" in item:
+                    raise KeyError('Could not find sheet %s' % repr(item))
+
+            def _find_xw_sheet(self, sheet_name: str):
+                """
+                Gets xw sheet of passed name, which may be either a
+                sheet name alone, or a book and sheet name separated
+                by '::', from the index of sheets in all open books.
+                Returns None if the name is not in the index, or if the
+                indexed sheet or its book has since been renamed or
+                removed, in which case the index should be rebuilt.
+                :param sheet_name: str
+                :return: xlwings.Sheet or None
+                """
+                xw_sheet = self._sheet_index.get(sheet_name)
+                if xw_sheet is None:
+                    return None
+                book_name, _, name = sheet_name.rpartition("::")
+                try:
+                    if xw_sheet.name != name or \
+                            book_name and xw_sheet.book.name != book_name:
+                        return None
+                except Exception:  # sheet or book no longer exists
+                    return None
+                return xw_sheet
+
+            def _get_sheet_index(self) -> dict:
+                """
+                Gets dict of xw sheets in all open books, keyed by both
+                'book_name::sheet_name' and the sheet name alone.
+                Where books have sheets of the same name, the sheet name
+                alone refers to the first found.
+                :return: dict
+                """
+                index = {}
+                for xw_book in self.books:
+                    for xw_sheet in xw_book.sheets:
+                        index['%s::%s' % (xw_book.name, xw_sheet.name)] = \
+                            xw_sheet
+                        index.setdefault(xw_sheet.name, xw_sheet)
+                return index
 
             @property
             def books(self):
@@ -1617,6 +2070,8 @@ class Office:
                     reference_column_index=reference_column_index,
                     reference_row_index=reference_row_index
                 )
+                # bound once here, rather than looked up for each cell
+                self._get_range = i7e_sheet.range
 
             @staticmethod
             def key(i7e_sheet):
@@ -1633,6 +2088,131 @@ class Office:
             def screen_updating(self, new_bool: bool) -> None:
                 self.i7e_sheet.book.app.screen_updating = new_bool
 
+            @contextmanager
+            def batch(self):
+                """
+                Context manager within which Excel's calculation is set
+                to manual and screen updating is turned off.
+                Both are restored on exit, and the workbook then
+                recalculated if calculation was not already manual.
+                :return: Generator
+                """
+                app = self.i7e_sheet.book.app
+                calculation = app.calculation
+                screen_updating = app.screen_updating
+                app.calculation = 'manual'
+                app.screen_updating = False
+                try:
+                    yield
+                finally:
+                    app.calculation = calculation
+                    app.screen_updating = screen_updating
+                    if calculation != 'manual':
+                        app.calculate()
+
+            def _get_line_values(
+                    self,
+                    axis: str,
+                    index: int,
+                    start: int=0,
+                    stop: int=None
+            ) -> list:
+                """
+                Gets list of values of cells in the row (axis 'x') or
+                column (axis 'y') of passed index, using a single range
+                read rather than one read per cell.
+                :param axis: str
+                :param index: int
+                :param start: int
+                :param stop: int or None
+                :return: list
+                """
+                if self.snapshot:  # snapshot values are already in memory
+                    return super()._get_line_values(axis, index, start, stop)
+                if stop is None:
+                    # read to the end of the used range, then trim the
+                    # result to the cells that iteration would reach.
+                    last_cell = self.i7e_sheet.used_range.last_cell
+                    end = last_cell.column if axis == 'x' else last_cell.row
+                    values = self._get_line_values(axis, index, 0, end)
+                    return _Util.trim_line_values(values)[start:]
+                if stop <= start:
+                    return []
+                rng = self._line_range(axis, index, start, stop)
+                return rng.options(ndim=1).value
+
+            def _line_range(
+                    self,
+                    axis: str,
+                    index: int,
+                    start: int,
+                    stop: int
+            ):
+                """
+                Gets XW Range of cells in the row (axis 'x') or
+                column (axis 'y') of passed index, from start up to
+                but not including stop.
+                :param axis: str
+                :param index: int
+                :param start: int
+                :param stop: int
+                :return: xlwings.Range
+                """
+                assert stop > start
+                # XW passes position tuples as row, column (1 based)
+                if axis == 'x':
+                    return self._get_range(
+                        (index + 1, start + 1), (index + 1, stop))
+                else:
+                    return self._get_range(
+                        (start + 1, index + 1), (stop, index + 1))
+
+            def _read_block_values(
+                    self,
+                    r1: int,
+                    c1: int,
+                    r2: int,
+                    c2: int
+            ) -> list:
+                """
+                Gets list of row lists of values in the block of cells
+                from row r1, column c1 to row r2, column c2 (inclusive),
+                using a single range read.
+                :param r1: int
+                :param c1: int
+                :param r2: int
+                :param c2: int
+                :return: list[list]
+                """
+                if self.snapshot:  # snapshot values are already in memory
+                    return super()._read_block_values(r1, c1, r2, c2)
+                # XW passes position tuples as row, column (1 based)
+                rng = self._get_range((r1 + 1, c1 + 1), (r2 + 1, c2 + 1))
+                return rng.options(ndim=2).value
+
+            def _write_block_values(
+                    self,
+                    r1: int,
+                    c1: int,
+                    rows: list
+            ) -> None:
+                """
+                Sets values of the block of cells whose top left cell is
+                at row r1, column c1 using a single range write.
+                :param r1: int
+                :param c1: int
+                :param rows: list[list]
+                :return: None
+                """
+                if self.snapshot:  # values must be set in snapshot
+                    super()._write_block_values(r1, c1, rows)
+                    return
+                self._get_range((r1 + 1, c1 + 1)).value = rows
+                # cells were not set individually, so their caches
+                # must be cleared here.
+                self._clear_block_caches(
+                    r1, c1, r1 + len(rows) - 1, c1 + len(rows[0]) - 1)
+
             @Sheet.enduring_cache
             def __str__(self) -> str:
                 return 'Sheet[%s::%s]' % (
@@ -1657,29 +2237,11 @@ class Office:
                     assert isinstance(self._height, int)
                     assert (self._width == 0) == (self._height == 0)
                     if self._width == 0 and self._height == 0:
-                        values = [[]]
-                    elif self._width == 1 and self._height == 1:
-                        values = [[self._sheet.i7e_sheet.range('A1').value]]
-                    elif self._height == 1:
-                        values = [self._sheet.i7e_sheet.range(
-                            'A1', (1, self._width)
-                        ).value]
-                    elif self._width == 1:
-                        values = [[value] for value in
-                                  self._sheet.i7e_sheet.range(
-                                  'A1', (self._height, 1)
-                                  )]
-                    elif self._width > 1 and self._height > 1:
-                        values = self._sheet.i7e_sheet.range(
-                            'A1',  # start cell
-                            (self._height, self._width)  # end cell
-                        ).value
-                    else:
-                        raise ValueError(
-                            'Snapshot:_get_values: width, height were %s, %s' %
-                            self._width, self._height)
-                    assert values is not None  # just sanity checking
-                    return values
+                        return [[]]
+                    # read as a single block, which always gives a list
+                    # of row lists, whatever the width and height.
+                    return self._sheet._read_block_values(
+                        0, 0, self._height - 1, self._width - 1)
 
                 def write(self):
                     self._sheet.i7e_sheet.range('A1').value = self._values
@@ -1688,57 +2250,82 @@ class Office:
             """
             XW Line
             """
-            pass  # no methods defined here at this time.
-            # keeping for MR0 purposes
+            __slots__ = ()
+
+            def __iter__(self):
+                """
+                Returns iterator of cells in line.
+                The extent of the line is found from its values, which
+                are read together, rather than by CellLine checking
+                each cell in turn.
+                :return: Iterator[Cell]
+                """
+                get_cell = self._unchecked_get_cell_by_index
+                return (get_cell(i) for i in range(len(self.values)))
+
+            def clear(self, include_header: bool = False) -> None:
+                """
+                Clears line of cells.
+                Values and colors of all cleared cells are each set
+                by a single range write, rather than two writes per cell.
+                If Include header is True; clears cell data in cells
+                preceding and including header row.
+                :param include_header: bool
+                :return: None
+                """
+                if self.sheet.snapshot:  # values must be set in snapshot
+                    super().clear(include_header)
+                    return
+                start = 0 if include_header else self.name_cell_index + 1
+                stop = len(self.values)
+                if stop <= start:
+                    return
+                rng = self.sheet._line_range(
+                    self._axis, self.index, start, stop)
+                rng.value = None
+                rng.color = None  # XW equivalent of DEFAULT_COLOR
+                # cells were not set individually, so their caches
+                # (and those of their rows, columns and sheet) must be
+                # cleared here.
+                if self._axis == 'x':
+                    self.sheet._clear_block_caches(
+                        self.index, start, self.index, stop - 1)
+                else:
+                    self.sheet._clear_block_caches(
+                        start, self.index, stop - 1, self.index)
 
         class Column(Line, Column):
             """
             XW Column
             """
-            def __init__(
-                    self,
-                    sheet: Sheet,
-                    column_index: int,
-                    reference_column_index: int=0):
-                super().__init__(
-                    sheet=sheet,
-                    index=column_index,
-                    reference_index=reference_column_index
-                )
-
-            def __iter__(self):
-                return self.get_iterator(axis='y')
+            __slots__ = ()
 
         class Row(Line, Row):
             """
             XW Row
             """
-            def __init__(
-                    self,
-                    sheet: Sheet,
-                    row_index: int,
-                    reference_row_index: int=0
-            ) -> None:
-                super().__init__(
-                    sheet=sheet,
-                    index=row_index,
-                    reference_index=reference_row_index,
-                )
-
-            def __iter__(self):
-                return self.get_iterator(axis='x')
+            __slots__ = ()
 
         class Cell(Cell):
             """
             XW Cell
             """
+            __slots__ = ('_cached_range',)
 
-            def set_color(self, color: int or list or tuple) -> None:
-                if color >= 0:
-                    color = Color(color)
+            def set_color(self, color: int | list | tuple | Color) -> None:
+                if isinstance(color, int):
+                    if color == DEFAULT_COLOR:
+                        self._range.color = None
+                    elif color >= 0:  # unpacked here, without a Color obj
+                        self._range.color = (
+                            (color >> 16) & 255,
+                            (color >> 8) & 255,
+                            color & 255,
+                        )
+                elif isinstance(color, Color):
                     self._range.color = color.rgb
-                elif color == -1:
-                    self._range.color = None
+                else:
+                    self._range.color = tuple(color)
 
             def get_color(self) -> int:
                 color_int = self._range.color
@@ -1749,21 +2336,27 @@ class Office:
             @property
             def _range(self):
                 """
-                Gets XW Range obj for this cell
+                Gets XW Range obj for this cell.
+                The Range is created on first use, and then kept for
+                reuse by later accesses.
                 :return: xlwings.Range
                 """
-                x, y = self.position
-                x += 1
-                y += 1  # correct to excel 1 based index
-                # XW passes position tuples as row, column
-                return self.sheet.i7e_sheet.range(y, x)
+                try:
+                    return self._cached_range
+                except AttributeError:
+                    x, y = self.position
+                    # XW passes position tuples as row, column, and uses
+                    # excel 1 based indices
+                    self._cached_range = self.sheet._get_range(y + 1, x + 1)
+                    return self._cached_range
 
             @property
             @Cell.value_cache
-            def value(self) -> int or float or str or None:
-                if self.sheet.snapshot:  # if sheet has a snapshot:
+            def value(self) -> int | float | str | None:
+                snapshot = self.sheet.snapshot
+                if snapshot:  # if sheet has a snapshot:
                     try:  # try to get value from snapshot
-                        return self.sheet.snapshot.get_value(self.x, self.y)
+                        return snapshot.get_value(*self.position)
                     except IndexError:
                         pass  # if it does not contain this cell x,y: get range
                 return self._range.value
@@ -1771,9 +2364,10 @@ class Office:
             @value.setter
             @Cell.clear_cache
             def value(self, new_v) -> None:
-                if self.sheet.snapshot:  # if sheet has a snapshot
+                snapshot = self.sheet.snapshot
+                if snapshot:  # if sheet has a snapshot
                     try:
-                        self.sheet.snapshot.set_value(self.x, self.y, new_v)
+                        snapshot.set_value(*self.position, new_v)
                         return
                     except IndexError:
                         pass  # if value outside snapshot bounds, set normally
@@ -1783,21 +2377,21 @@ class Office:
             def float(self):
                 # XW will only return number (float), str or None in most
                 # cases, others include Date, (etc)?
-                if isinstance(self.value, float):
-                    return self.value
+                value = self.value  # only get value from range once
+                if isinstance(value, float):
+                    return value
                 else:
                     return 0.
 
             @property
             def string(self):
-                if self.value is not None:
-                    string = str(self.value)
-                    # remove unneeded digits
-                    if isinstance(self.value, float) and string[-2:] == '.0':
-                        string = string[:-2]
-                    return string
-                else:
+                value = self.value  # only get value from range once
+                if value is None:
                     return ''
+                string = str(value)
+                if isinstance(value, float):  # remove unneeded digits
+                    string = string.removesuffix('.0')
+                return string
 
     class Uno(Interface):
         """
@@ -1821,32 +2415,30 @@ class Office:
                     )
                 self.model = py_uno_model
 
-            def __getitem__(self, item: str or int) -> Sheet:
+            def __getitem__(self, item: str | int) -> Sheet:
                 """
                 Gets identified sheet.
                 :param item: str or int
                 :return: Sheet
                 """
-                assert isinstance(item, (str, int))
                 # try to get appropriate sheet from uno model.
                 # If sheet index or name cannot be found, raise a more
                 # readable error message than the terribly unhelpful
                 # uno message.
-                if isinstance(item, int):
+                uno_sheets = self.model.Sheets
+                if type(item) is int:
                     try:
-                        return Office.Uno.Sheet(
-                            self.model.Sheets.getByIndex(item))
-                    except:  # can't seem to put the actual exception
-                        # class here
-                        raise IndexError('Could not retrieve sheet at index'
+                        uno_sheet = uno_sheets.getByIndex(item)
+                    except IndexOutOfBoundsException:
+                        raise IndexError('Could not retrieve sheet at index '
                                          '%s' % repr(item))
                 else:
                     try:
-                        return Office.Uno.Sheet(
-                            self.model.Sheets.getByName(item))
-                    except:
+                        uno_sheet = uno_sheets.getByName(item)
+                    except NoSuchElementException:
                         raise KeyError('Could not retrieve sheet with name %s'
                                        % repr(item))
+                return Office.Uno.Sheet(uno_sheet)
 
             def sheet_exists(self, *args: str) -> str:
                 """
@@ -1856,14 +2448,12 @@ class Office:
                 :return: str of first viable sheet name or None if no
                 viable name is found
                 """
-                assert all([isinstance(arg, str) for arg in args])
-                for sheet_name in args:
-                    try:
-                        self.model.Sheets.getByName(sheet_name)
-                    except:  # todo: find actual exception class
-                        pass
-                    else:
-                        return sheet_name
+                assert all(isinstance(arg, str) for arg in args)
+                names = frozenset(self.model.Sheets.ElementNames)
+                return next(
+                    (sheet_name for sheet_name in args if sheet_name in names),
+                    None
+                )
 
             @property
             def sheets(self):
@@ -1871,14 +2461,9 @@ class Office:
                 Generator returning each sheet in Model / Book
                 :return: Sheet
                 """
-                i = 0
-                while True:  # loop until break
-                    try:
-                        yield Office.Uno.Sheet(self.model.Sheets.getByIndex(i))
-                    except:
-                        break
-                    else:
-                        i += 1
+                uno_sheets = self.model.Sheets
+                for name in uno_sheets.ElementNames:
+                    yield Office.Uno.Sheet(uno_sheets.getByName(name))
 
             @property
             def sheet_names(self):
@@ -1904,57 +2489,99 @@ class Office:
                     reference_row_index=reference_row_index,
                     reference_column_index=reference_column_index
                 )
+                # bound once here, rather than looked up for each cell
+                self._get_uno_cell = i7e_sheet.getCellByPosition
+
+            @contextmanager
+            def batch(self):
+                """
+                Context manager within which the document's controllers
+                are locked, and its automatic calculation and row
+                height adjustment are turned off.
+                All are restored on exit, and the document then
+                recalculated if automatic calculation was enabled.
+                :return: Generator
+                """
+                # not an error; provided by macro caller
+                # noinspection PyUnresolvedReferences
+                document = XSCRIPTCONTEXT.getDesktop().getCurrentComponent()
+                auto_calculation = document.isAutomaticCalculationEnabled()
+                adjust_height = document.IsAdjustHeightEnabled
+                document.lockControllers()
+                document.enableAutomaticCalculation(False)
+                document.IsAdjustHeightEnabled = False
+                try:
+                    yield
+                finally:
+                    document.IsAdjustHeightEnabled = adjust_height
+                    document.enableAutomaticCalculation(auto_calculation)
+                    document.unlockControllers()
+                    if auto_calculation:
+                        document.calculate()
+
+            def _get_line_values(
+                    self,
+                    axis: str,
+                    index: int,
+                    start: int=0,
+                    stop: int=None
+            ) -> list:
+                """
+                Gets list of values of cells in the row (axis 'x') or
+                column (axis 'y') of passed index, using a single cell
+                range query rather than one query per cell.
+                :param axis: str
+                :param index: int
+                :param start: int
+                :param stop: int or None
+                :return: list
+                """
+                if stop is None:
+                    # read to the end of the used area, then trim the
+                    # result to the cells that iteration would reach.
+                    cursor = self.i7e_sheet.createCursor()
+                    cursor.gotoEndOfUsedArea(False)
+                    address = cursor.RangeAddress
+                    end = (address.EndColumn if axis == 'x' else
+                           address.EndRow) + 1
+                    values = self._get_line_values(axis, index, 0, end)
+                    return _Util.trim_line_values(values)[start:]
+                if stop <= start:
+                    return []
+                # uno positions are passed as left, top, right, bottom
+                if axis == 'x':
+                    data = self.i7e_sheet.getCellRangeByPosition(
+                        start, index, stop - 1, index).getDataArray()
+                    values = data[0]
+                else:
+                    data = self.i7e_sheet.getCellRangeByPosition(
+                        index, start, index, stop - 1).getDataArray()
+                    values = [row[0] for row in data]
+                # empty cells are returned as '', where Cell.value is None
+                return [None if value == '' else value for value in values]
 
         class Line(Line):
-            pass  # no methods defined here anymore,
+            __slots__ = ()  # no methods defined here anymore,
             # keeping this in place for MRO purposes
 
         class Column(Line, Column):
             """
             Handles usage of a column within a sheet
             """
-            def __init__(
-                    self,
-                    sheet: Sheet,
-                    column_index: int,
-                    reference_column_index: int=0):
-                super().__init__(
-                    sheet=sheet,
-                    index=column_index,
-                    reference_index=reference_column_index
-                )
-
-            def __iter__(self):
-                """
-                Returns iterable line of cells
-                :return: Iterable
-                """
-                return self.get_iterator(axis='y')
+            __slots__ = ()
 
         class Row(Line, Row):
             """
             Handles usage of a row within a sheet
             """
-
-            def __init__(
-                    self,
-                    sheet: Sheet,
-                    row_index: int,
-                    reference_row_index: int=0
-            ) -> None:
-                super().__init__(
-                    sheet=sheet,
-                    index=row_index,
-                    reference_index=reference_row_index,
-                )
-
-            def __iter__(self):
-                return self.get_iterator(axis='x')
+            __slots__ = ()
 
         class Cell(Cell):
             """
             Handles usage of an individual cell
             """
+            __slots__ = ('_cached_source_cell',)
+
             def set_color(self, color):
                 """
                 Sets cell background color
@@ -1981,30 +2608,39 @@ class Office:
             @property
             def _source_cell(self):
                 """
-                Gets PyUno cell from which values are drawn
+                Gets PyUno cell from which values are drawn.
+                The cell is fetched on first use, and then kept for
+                reuse by later accesses.
                 :return:
                 """
-                return self._uno_sheet.getCellByPosition(*self.position)
+                try:
+                    return self._cached_source_cell
+                except AttributeError:
+                    self._cached_source_cell = \
+                        self.sheet._get_uno_cell(*self.position)
+                    return self._cached_source_cell
 
             @property
             @Cell.value_cache
-            def value(self) -> int or float or str:
+            def value(self) -> int | float | str:
                 """
                 Gets value of cell.
                 :return: str or float
                 """
-                # get cell value type after formula evaluation has been
-                # carried out. This will return the cell value's type
-                # even if it is not a formula
-                t = self._source_cell.FormulaResultType.value
-                if t == 'TEXT':
-                    return self._source_cell.getString()
-                elif t == 'VALUE':
-                    return self._source_cell.getValue()
+                source_cell = self._source_cell
+                content_type = source_cell.Type
+                if content_type == FORMULA_CONTENT:
+                    # get cell value type after formula evaluation has
+                    # been carried out.
+                    content_type = source_cell.FormulaResultType
+                if content_type == TEXT_CONTENT:
+                    return source_cell.getString()
+                elif content_type == VALUE_CONTENT:
+                    return source_cell.getValue()
 
             @value.setter
             @Cell.clear_cache
-            def value(self, new_value: int or float or str) -> None:
+            def value(self, new_value: int | float | str) -> None:
                 """
                 Sets source cell string and number value appropriately for
                 a new value.
@@ -2047,7 +2683,7 @@ class Office:
 
             @float.setter
             @Cell.clear_cache
-            def float(self, new_float: int or float) -> None:
+            def float(self, new_float: int | float) -> None:
                 """
                 Sets float value of source cell directly
                 :param new_float: int or float
@@ -2058,7 +2694,7 @@ class Office:
                 self._source_cell.setValue(new_value)
 
     @staticmethod
-    def get_interface() -> str or None:
+    def get_interface() -> str | None:
         """
         Test for what interface is using this macro, and return the string
         of the appropriate class that should be used.
@@ -2073,19 +2709,27 @@ class Office:
         else:
             return 'Uno'
 
-        if xw is not None:
+        if _Util.get_xw() is not None:
             return 'XW'
 
         # otherwise, return None / False
 
     @staticmethod
     def get_interface_class() -> Interface:
-        """Gets interface class, ie, Uno or XW"""
-        interface = Office.get_interface()  # gets str name of interface class
-        if not interface:
-            raise ValueError('Should be run as macro using XLWings or PyUno.'
-                             'Neither could be detected.')
-        return getattr(Office, interface)
+        """
+        Gets interface class, ie, Uno or XW.
+        The interface is only detected on first call, since the
+        environment running the macro does not change within a process.
+        """
+        global _interface_class
+        if _interface_class is None:
+            # gets str name of interface class
+            interface = Office.get_interface()
+            if not interface:
+                raise ValueError('Should be run as macro using XLWings or '
+                                 'PyUno. Neither could be detected.')
+            _interface_class = getattr(Office, interface)
+        return _interface_class
 
     @staticmethod
     def get_model() -> Model:
@@ -2129,18 +2773,18 @@ class Color:
         elif isinstance(color, tuple):
             if len(color) != 3:
                 raise ValueError(
-                    "Color: RGB tuple should be len 3. got: %s" % color
+                    "Color: RGB tuple should be len 3. got: %s" % (color,)
                 )
-            if any([(not isinstance(value, int) or value > 255)
-                    for value in color]):
+            r, g, b = color
+            # any value outside 0-255 (including negative values) has
+            # bits set outside of the lowest byte.
+            if not (type(r) is int and type(g) is int and type(b) is int) \
+                    or (r | g | b) & ~0xFF:
                 raise ValueError(
-                    "Color: each value in color rgb tuple should be an int"
-                    "between 0 and 255. Got: %s" % color
+                    "Color: each value in color rgb tuple should be an int "
+                    "between 0 and 255. Got: %s" % (color,)
                 )
-            r = color[0]
-            g = color[1]
-            b = color[2]
-            self.color = (r << 16) + (g << 8) + b
+            self.color = (r << 16) | (g << 8) | b
 
         elif isinstance(color, str):
             raise ValueError("Color does not yet support string colors")
@@ -2156,3 +2800,53 @@ class Color:
         g = (self.color >> 8) & 255
         b = self.color & 255
         return r, g, b
+
+    @staticmethod
+    def bulk_pack(rgb) -> 'numpy.ndarray':
+        """
+        Gets int colors from many r, g, b values at once.
+        Requires numpy.
+        :param rgb: array-like of shape (n, 3), of ints between 0 and 255
+        :return: np.ndarray of n int colors
+        """
+        np = _Util.get_np()
+        if np is None:
+            raise ImportError('Color.bulk_pack requires numpy')
+        rgb = np.asarray(rgb)
+        if rgb.ndim != 2 or rgb.shape[1] != 3:
+            raise ValueError('Color: bulk_pack expects an array of shape '
+                             '(n, 3). Got shape: %s' % (rgb.shape,))
+        if rgb.dtype.kind not in 'iu' and rgb.size:
+            raise ValueError('Color: bulk_pack expects an array of ints. '
+                             'Got dtype: %s' % rgb.dtype)
+        rgb = rgb.astype(np.int64, copy=False)
+        if ((rgb < 0) | (rgb > 255)).any():
+            raise ValueError('Color: each value in rgb array should be '
+                             'between 0 and 255')
+        return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+    @staticmethod
+    def bulk_unpack(colors) -> 'numpy.ndarray':
+        """
+        Gets r, g, b values from many int colors at once.
+        Requires numpy.
+        :param colors: array-like of n int colors, between 0 and 0xFFFFFF
+        :return: np.ndarray of shape (n, 3) and dtype uint8
+        """
+        np = _Util.get_np()
+        if np is None:
+            raise ImportError('Color.bulk_unpack requires numpy')
+        colors = np.asarray(colors)
+        if colors.ndim != 1 or \
+                colors.dtype.kind not in 'iu' and colors.size:
+            raise ValueError('Color: bulk_unpack expects a 1d array of '
+                             'ints. Got shape: %s, dtype: %s' %
+                             (colors.shape, colors.dtype))
+        if ((colors < 0) | (colors > 0xFFFFFF)).any():
+            raise ValueError('Color: each value in colors array should be '
+                             'between 0 and 0xFFFFFF')
+        colors = np.ascontiguousarray(colors).astype('<u4', copy=False)
+        # viewed as little endian bytes, each color is b, g, r, 0, so
+        # its channels are picked out without any shifting or masking.
+        channels = colors.reshape(-1).view(np.uint8).reshape(-1, 4)
+        return channels[:, 2::-1].copy()